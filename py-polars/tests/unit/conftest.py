@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import os
-from typing import List, cast
+from functools import lru_cache
+from typing import cast
 
 import pytest
 
@@ -31,16 +32,6 @@ FOODS_CSV_GLOB = os.path.join(
     "foods*.csv",
 )
 
-FOODS_PARQUET = os.path.join(
-    EXAMPLES_DIR,
-    "foods1.parquet",
-)
-
-FOODS_IPC = os.path.join(
-    EXAMPLES_DIR,
-    "foods1.ipc",
-)
-
 FOODS_NDJSON = os.path.join(
     EXAMPLES_DIR,
     "foods1.ndjson",
@@ -67,24 +58,30 @@ def foods_csv_glob() -> str:
     return FOODS_CSV
 
 
-if not os.path.isfile(FOODS_PARQUET):
-    pl.read_csv(FOODS_CSV).write_parquet(FOODS_PARQUET)
+@lru_cache(maxsize=1)
+def _load_foods() -> pl.DataFrame:
+    return pl.read_csv(FOODS_CSV)
 
-if not os.path.isfile(FOODS_IPC):
-    pl.read_csv(FOODS_CSV).write_ipc(FOODS_IPC)
 
-if not os.path.isfile(FOODS_NDJSON):
-    pl.read_csv(FOODS_CSV).write_json(FOODS_NDJSON, json_lines=True)
+# the parquet and ipc versions of the foods dataset are written once per session
+# to a temporary directory, so that no test artifacts end up in the source tree
+@pytest.fixture(scope="session")
+def foods_dir(tmp_path_factory: pytest.TempPathFactory) -> str:
+    return str(tmp_path_factory.mktemp("foods", numbered=False))
 
 
-@pytest.fixture()
-def foods_ipc() -> str:
-    return FOODS_IPC
+@pytest.fixture(scope="session")
+def foods_ipc(foods_dir: str) -> str:
+    path = os.path.join(foods_dir, "foods1.ipc")
+    _load_foods().write_ipc(path)
+    return path
 
 
-@pytest.fixture()
-def foods_parquet() -> str:
-    return FOODS_PARQUET
+@pytest.fixture(scope="session")
+def foods_parquet(foods_dir: str) -> str:
+    path = os.path.join(foods_dir, "foods1.parquet")
+    _load_foods().write_parquet(path)
+    return path
 
 
 @pytest.fixture()
@@ -92,8 +89,8 @@ def foods_ndjson() -> str:
     return FOODS_NDJSON
 
 
-@pytest.fixture()
-def df() -> pl.DataFrame:
+@pytest.fixture(scope="session")
+def df_session() -> pl.DataFrame:
     df = pl.DataFrame(
         {
             "bools": [False, True, False],
@@ -123,15 +120,15 @@ def df() -> pl.DataFrame:
     )
 
 
-@pytest.fixture()
-def df_no_lists(df: pl.DataFrame) -> pl.DataFrame:
-    return df.select(
+@pytest.fixture(scope="session")
+def df_no_lists_session(df_session: pl.DataFrame) -> pl.DataFrame:
+    return df_session.select(
         pl.all().exclude(["list_str", "list_int", "list_bool", "list_int", "list_flt"])
     )
 
 
-@pytest.fixture()
-def fruits_cars() -> pl.DataFrame:
+@pytest.fixture(scope="session")
+def fruits_cars_session() -> pl.DataFrame:
     return pl.DataFrame(
         {
             "A": [1, 2, 3, 4, 5],
@@ -142,24 +139,38 @@ def fruits_cars() -> pl.DataFrame:
     )
 
 
-ISO8601_FORMATS = []
-for T in ["T", " "]:
-    for hms in (
-        [
-            f"{T}%H:%M:%S",
-            f"{T}%H%M%S",
-            f"{T}%H:%M",
-            f"{T}%H%M",
-        ]
-        + [f"{T}%H:%M:%S.{fraction}" for fraction in ["%9f", "%6f", "%3f"]]
-        + [f"{T}%H%M%S.{fraction}" for fraction in ["%9f", "%6f", "%3f"]]
-        + [""]
-    ):
+# the frames above are built once per session; tests get a cheap clone so that
+# in-place mutations (e.g. renaming columns) cannot leak into other tests
+@pytest.fixture()
+def df(df_session: pl.DataFrame) -> pl.DataFrame:
+    return df_session.clone()
+
+
+@pytest.fixture()
+def df_no_lists(df_no_lists_session: pl.DataFrame) -> pl.DataFrame:
+    return df_no_lists_session.clone()
+
+
+@pytest.fixture()
+def fruits_cars(fruits_cars_session: pl.DataFrame) -> pl.DataFrame:
+    return fruits_cars_session.clone()
+
+
+@lru_cache(maxsize=1)
+def _iso8601_formats() -> tuple[str, ...]:
+    fractions = [f".{fraction}" for fraction in ["%9f", "%6f", "%3f"]]
+    time_formats = (
+        ["%H:%M:%S", "%H%M%S", "%H:%M", "%H%M"]
+        + [f"%H:%M:%S{fraction}" for fraction in fractions]
+        + [f"%H%M%S{fraction}" for fraction in fractions]
+    )
+    formats = []
+    for hms in [f"{T}{fmt}" for T in ["T", " "] for fmt in time_formats] + [""]:
         for date_sep in ("/", "-", ""):
-            fmt = f"%Y{date_sep}%m{date_sep}%d{hms}"
-            ISO8601_FORMATS.append(fmt)
+            formats.append(f"%Y{date_sep}%m{date_sep}%d{hms}")
+    return tuple(formats)
 
 
-@pytest.fixture(params=ISO8601_FORMATS)
-def iso8601_format(request: pytest.FixtureRequest) -> list[str]:
-    return cast(List[str], request.param)
+@pytest.fixture(params=_iso8601_formats())
+def iso8601_format(request: pytest.FixtureRequest) -> str:
+    return cast(str, request.param)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import typing
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, Tuple
 
 import numpy as np
 import pandas as pd
@@ -14,34 +14,56 @@ import polars.testing
 if TYPE_CHECKING:
     from polars.internals.type_aliases import JoinStrategy
 
+    RandomIntFrames = Dict[
+        Tuple[int, int],
+        Tuple[pd.DataFrame, pd.DataFrame, pl.DataFrame, pl.DataFrame],
+    ]
+
+
+def assert_frame_dict(actual: pl.DataFrame, expected: dict[str, list[Any]]) -> None:
+    # compare in polars instead of materializing `actual` with `to_dict`; like the
+    # dict comparison this does not depend on the order of the columns
+    assert set(actual.columns) == set(expected)
+    pl.testing.assert_frame_equal(
+        actual, pl.DataFrame(expected, schema=actual.schema), check_exact=True
+    )
+
 
 def test_semi_anti_join() -> None:
     df_a = pl.DataFrame({"key": [1, 2, 3], "payload": ["f", "i", None]})
 
     df_b = pl.DataFrame({"key": [3, 4, 5, None]})
 
-    assert df_a.join(df_b, on="key", how="anti").to_dict(False) == {
-        "key": [1, 2],
-        "payload": ["f", "i"],
-    }
-    assert df_a.join(df_b, on="key", how="semi").to_dict(False) == {
-        "key": [3],
-        "payload": [None],
-    }
+    assert_frame_dict(
+        df_a.join(df_b, on="key", how="anti"),
+        {
+            "key": [1, 2],
+            "payload": ["f", "i"],
+        },
+    )
+    assert_frame_dict(
+        df_a.join(df_b, on="key", how="semi"),
+        {
+            "key": [3],
+            "payload": [None],
+        },
+    )
 
     # lazy
-    assert df_a.lazy().join(df_b.lazy(), on="key", how="anti").collect().to_dict(
-        False
-    ) == {
-        "key": [1, 2],
-        "payload": ["f", "i"],
-    }
-    assert df_a.lazy().join(df_b.lazy(), on="key", how="semi").collect().to_dict(
-        False
-    ) == {
-        "key": [3],
-        "payload": [None],
-    }
+    assert_frame_dict(
+        df_a.lazy().join(df_b.lazy(), on="key", how="anti").collect(),
+        {
+            "key": [1, 2],
+            "payload": ["f", "i"],
+        },
+    )
+    assert_frame_dict(
+        df_a.lazy().join(df_b.lazy(), on="key", how="semi").collect(),
+        {
+            "key": [3],
+            "payload": [None],
+        },
+    )
 
     df_a = pl.DataFrame(
         {"a": [1, 2, 3, 1], "b": ["a", "b", "c", "a"], "payload": [10, 20, 30, 40]}
@@ -49,16 +71,22 @@ def test_semi_anti_join() -> None:
 
     df_b = pl.DataFrame({"a": [3, 3, 4, 5], "b": ["c", "c", "d", "e"]})
 
-    assert df_a.join(df_b, on=["a", "b"], how="anti").to_dict(False) == {
-        "a": [1, 2, 1],
-        "b": ["a", "b", "a"],
-        "payload": [10, 20, 40],
-    }
-    assert df_a.join(df_b, on=["a", "b"], how="semi").to_dict(False) == {
-        "a": [3],
-        "b": ["c"],
-        "payload": [30],
-    }
+    assert_frame_dict(
+        df_a.join(df_b, on=["a", "b"], how="anti"),
+        {
+            "a": [1, 2, 1],
+            "b": ["a", "b", "a"],
+            "payload": [10, 20, 40],
+        },
+    )
+    assert_frame_dict(
+        df_a.join(df_b, on=["a", "b"], how="semi"),
+        {
+            "a": [3],
+            "b": ["c"],
+            "payload": [30],
+        },
+    )
 
 
 def test_join_same_cat_src() -> None:
@@ -74,38 +102,37 @@ def test_join_same_cat_src() -> None:
     }
 
 
-def test_sorted_merge_joins() -> None:
-    for reverse in [False, True]:
-        n = 30
-        df_a = pl.DataFrame(
-            {"a": np.sort(np.random.randint(0, n // 2, n))}
-        ).with_row_count("row_a")
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("cast_to", [int, str, float])
+def test_sorted_merge_joins(reverse: bool, cast_to: type) -> None:
+    np.random.seed(0)
+    n = 30
+    df_a = pl.DataFrame({"a": np.sort(np.random.randint(0, n // 2, n))}).with_row_count(
+        "row_a"
+    )
 
-        df_b = pl.DataFrame(
-            {"a": np.sort(np.random.randint(0, n // 2, n // 2))}
-        ).with_row_count("row_b")
+    df_b = pl.DataFrame(
+        {"a": np.sort(np.random.randint(0, n // 2, n // 2))}
+    ).with_row_count("row_b")
 
-        if reverse:
-            df_a = df_a.select(pl.all().reverse())
-            df_b = df_b.select(pl.all().reverse())
+    if reverse:
+        df_a = df_a.select(pl.all().reverse())
+        df_b = df_b.select(pl.all().reverse())
 
-        join_strategies: list[JoinStrategy] = ["left", "inner"]
-        for cast_to in [int, str, float]:
-            for how in join_strategies:
-                df_a_ = df_a.with_column(pl.col("a").cast(cast_to))
-                df_b_ = df_b.with_column(pl.col("a").cast(cast_to))
+    df_a_ = df_a.with_columns([pl.col("a").cast(cast_to)])
+    df_b_ = df_b.with_columns([pl.col("a").cast(cast_to)])
+    df_a_sorted = df_a.with_columns([pl.col("a").cast(cast_to).set_sorted(reverse)])
+    df_b_sorted = df_b.with_columns([pl.col("a").cast(cast_to).set_sorted(reverse)])
 
-                # hash join
-                out_hash_join = df_a_.join(df_b_, on="a", how=how)
+    join_strategies: list[JoinStrategy] = ["left", "inner"]
+    for how in join_strategies:
+        # hash join
+        out_hash_join = df_a_.join(df_b_, on="a", how=how)
 
-                # sorted merge join
-                out_sorted_merge_join = df_a_.with_column(
-                    pl.col("a").set_sorted(reverse)
-                ).join(
-                    df_b_.with_column(pl.col("a").set_sorted(reverse)), on="a", how=how
-                )
+        # sorted merge join
+        out_sorted_merge_join = df_a_sorted.join(df_b_sorted, on="a", how=how)
 
-                assert out_hash_join.frame_equal(out_sorted_merge_join)
+        pl.testing.assert_frame_equal(out_hash_join, out_sorted_merge_join)
 
 
 def test_join_negative_integers() -> None:
@@ -125,47 +152,58 @@ def test_join_negative_integers() -> None:
     )
 
     for dt in [pl.Int8, pl.Int16, pl.Int32, pl.Int64]:
-        assert (
-            df1.with_column(pl.all().cast(dt))
-            .join(df2.with_column(pl.all().cast(dt)), on="a", how="inner")
-            .to_dict(False)
-            == expected
+        assert_frame_dict(
+            df1.with_columns([pl.all().cast(dt)]).join(
+                df2.with_columns([pl.all().cast(dt)]), on="a", how="inner"
+            ),
+            expected,
         )
 
 
 def test_join_asof_floats() -> None:
     df1 = pl.DataFrame({"a": [1.0, 2.0, 3.0], "b": ["lrow1", "lrow2", "lrow3"]})
     df2 = pl.DataFrame({"a": [0.59, 1.49, 2.89], "b": ["rrow1", "rrow2", "rrow3"]})
-    assert df1.join_asof(df2, on="a", strategy="backward").to_dict(False) == {
-        "a": [1.0, 2.0, 3.0],
-        "b": ["lrow1", "lrow2", "lrow3"],
-        "b_right": ["rrow1", "rrow2", "rrow3"],
-    }
+    assert_frame_dict(
+        df1.join_asof(df2, on="a", strategy="backward"),
+        {
+            "a": [1.0, 2.0, 3.0],
+            "b": ["lrow1", "lrow2", "lrow3"],
+            "b_right": ["rrow1", "rrow2", "rrow3"],
+        },
+    )
 
     # with by argument
     # 5740
-    df1 = pl.DataFrame(
-        {"b": np.linspace(0, 5, 7), "c": ["x" if i < 4 else "y" for i in range(7)]}
+    df1 = pl.DataFrame({"b": np.linspace(0, 5, 7)}).with_columns(
+        [
+            pl.when(pl.arange(0, 7, eager=False) < 4)
+            .then(pl.lit("x"))
+            .otherwise(pl.lit("y"))
+            .alias("c")
+        ]
     )
     df2 = pl.DataFrame(
         {
             "val": [0, 2.5, 2.6, 2.7, 3.4, 4, 5],
             "c": ["x", "x", "x", "y", "y", "y", "y"],
         }
-    ).with_column(pl.col("val").alias("b"))
-    assert df1.join_asof(df2, on="b", by="c").to_dict(False) == {
-        "b": [
-            0.0,
-            0.8333333333333334,
-            1.6666666666666667,
-            2.5,
-            3.3333333333333335,
-            4.166666666666667,
-            5.0,
-        ],
-        "c": ["x", "x", "x", "x", "y", "y", "y"],
-        "val": [0.0, 0.0, 0.0, 2.5, 2.7, 4.0, 5.0],
-    }
+    ).with_columns([pl.col("val").alias("b")])
+    assert_frame_dict(
+        df1.join_asof(df2, on="b", by="c"),
+        {
+            "b": [
+                0.0,
+                0.8333333333333334,
+                1.6666666666666667,
+                2.5,
+                3.3333333333333335,
+                4.166666666666667,
+                5.0,
+            ],
+            "c": ["x", "x", "x", "x", "y", "y", "y"],
+            "val": [0.0, 0.0, 0.0, 2.5, 2.7, 4.0, 5.0],
+        },
+    )
 
 
 def test_join_asof_tolerance() -> None:
@@ -195,33 +233,35 @@ def test_join_asof_tolerance() -> None:
         }
     )
 
-    assert df_trades.join_asof(
-        df_quotes, on="time", by="stock", tolerance="2s"
-    ).to_dict(False) == {
-        "time": [
-            datetime(2020, 1, 1, 9, 0, 1),
-            datetime(2020, 1, 1, 9, 0, 1),
-            datetime(2020, 1, 1, 9, 0, 3),
-            datetime(2020, 1, 1, 9, 0, 6),
-        ],
-        "stock": ["A", "B", "B", "C"],
-        "trade": [101, 299, 301, 500],
-        "quote": [100, None, 300, 501],
-    }
+    assert_frame_dict(
+        df_trades.join_asof(df_quotes, on="time", by="stock", tolerance="2s"),
+        {
+            "time": [
+                datetime(2020, 1, 1, 9, 0, 1),
+                datetime(2020, 1, 1, 9, 0, 1),
+                datetime(2020, 1, 1, 9, 0, 3),
+                datetime(2020, 1, 1, 9, 0, 6),
+            ],
+            "stock": ["A", "B", "B", "C"],
+            "trade": [101, 299, 301, 500],
+            "quote": [100, None, 300, 501],
+        },
+    )
 
-    assert df_trades.join_asof(
-        df_quotes, on="time", by="stock", tolerance="1s"
-    ).to_dict(False) == {
-        "time": [
-            datetime(2020, 1, 1, 9, 0, 1),
-            datetime(2020, 1, 1, 9, 0, 1),
-            datetime(2020, 1, 1, 9, 0, 3),
-            datetime(2020, 1, 1, 9, 0, 6),
-        ],
-        "stock": ["A", "B", "B", "C"],
-        "trade": [101, 299, 301, 500],
-        "quote": [100, None, 300, None],
-    }
+    assert_frame_dict(
+        df_trades.join_asof(df_quotes, on="time", by="stock", tolerance="1s"),
+        {
+            "time": [
+                datetime(2020, 1, 1, 9, 0, 1),
+                datetime(2020, 1, 1, 9, 0, 1),
+                datetime(2020, 1, 1, 9, 0, 3),
+                datetime(2020, 1, 1, 9, 0, 6),
+            ],
+            "stock": ["A", "B", "B", "C"],
+            "trade": [101, 299, 301, 500],
+            "quote": [100, None, 300, None],
+        },
+    )
 
 
 def test_join_asof_tolerance_forward() -> None:
@@ -253,51 +293,60 @@ def test_join_asof_tolerance_forward() -> None:
         }
     )
 
-    assert df_quotes.join_asof(
-        df_trades, on="time", by="stock", tolerance="2s", strategy="forward"
-    ).to_dict(False) == {
-        "time": [
-            datetime(2020, 1, 1, 9, 0, 0),
-            datetime(2020, 1, 1, 9, 0, 2),
-            datetime(2020, 1, 1, 9, 0, 4),
-            datetime(2020, 1, 1, 9, 0, 6),
-            datetime(2020, 1, 1, 9, 0, 7),
-        ],
-        "stock": ["A", "B", "C", "A", "D"],
-        "quote": [100, 300, 501, 102, 10],
-        "trade": [101, 301, 500, None, 10],
-    }
+    assert_frame_dict(
+        df_quotes.join_asof(
+            df_trades, on="time", by="stock", tolerance="2s", strategy="forward"
+        ),
+        {
+            "time": [
+                datetime(2020, 1, 1, 9, 0, 0),
+                datetime(2020, 1, 1, 9, 0, 2),
+                datetime(2020, 1, 1, 9, 0, 4),
+                datetime(2020, 1, 1, 9, 0, 6),
+                datetime(2020, 1, 1, 9, 0, 7),
+            ],
+            "stock": ["A", "B", "C", "A", "D"],
+            "quote": [100, 300, 501, 102, 10],
+            "trade": [101, 301, 500, None, 10],
+        },
+    )
 
-    assert df_quotes.join_asof(
-        df_trades, on="time", by="stock", tolerance="1s", strategy="forward"
-    ).to_dict(False) == {
-        "time": [
-            datetime(2020, 1, 1, 9, 0, 0),
-            datetime(2020, 1, 1, 9, 0, 2),
-            datetime(2020, 1, 1, 9, 0, 4),
-            datetime(2020, 1, 1, 9, 0, 6),
-            datetime(2020, 1, 1, 9, 0, 7),
-        ],
-        "stock": ["A", "B", "C", "A", "D"],
-        "quote": [100, 300, 501, 102, 10],
-        "trade": [None, 301, None, None, 10],
-    }
+    assert_frame_dict(
+        df_quotes.join_asof(
+            df_trades, on="time", by="stock", tolerance="1s", strategy="forward"
+        ),
+        {
+            "time": [
+                datetime(2020, 1, 1, 9, 0, 0),
+                datetime(2020, 1, 1, 9, 0, 2),
+                datetime(2020, 1, 1, 9, 0, 4),
+                datetime(2020, 1, 1, 9, 0, 6),
+                datetime(2020, 1, 1, 9, 0, 7),
+            ],
+            "stock": ["A", "B", "C", "A", "D"],
+            "quote": [100, 300, 501, 102, 10],
+            "trade": [None, 301, None, None, 10],
+        },
+    )
 
     # Sanity check that this gives us equi-join
-    assert df_quotes.join_asof(
-        df_trades, on="time", by="stock", tolerance="0s", strategy="forward"
-    ).to_dict(False) == {
-        "time": [
-            datetime(2020, 1, 1, 9, 0, 0),
-            datetime(2020, 1, 1, 9, 0, 2),
-            datetime(2020, 1, 1, 9, 0, 4),
-            datetime(2020, 1, 1, 9, 0, 6),
-            datetime(2020, 1, 1, 9, 0, 7),
-        ],
-        "stock": ["A", "B", "C", "A", "D"],
-        "quote": [100, 300, 501, 102, 10],
-        "trade": [None, None, None, None, 10],
-    }
+    assert_frame_dict(
+        df_quotes.join_asof(
+            df_trades, on="time", by="stock", tolerance="0s", strategy="forward"
+        ),
+        {
+            "time": [
+                datetime(2020, 1, 1, 9, 0, 0),
+                datetime(2020, 1, 1, 9, 0, 2),
+                datetime(2020, 1, 1, 9, 0, 4),
+                datetime(2020, 1, 1, 9, 0, 6),
+                datetime(2020, 1, 1, 9, 0, 7),
+            ],
+            "stock": ["A", "B", "C", "A", "D"],
+            "quote": [100, 300, 501, 102, 10],
+            "trade": [None, None, None, None, 10],
+        },
+    )
 
 
 def test_deprecated() -> None:
@@ -352,15 +401,6 @@ def test_join() -> None:
     assert joined["k"].null_count() == 1
     assert joined["a"].null_count() == 0
 
-    # we need to pass in a column to join on, either by supplying `on`, or both
-    # `left_on` and `right_on`
-    with pytest.raises(ValueError):
-        df_left.join(df_right)
-    with pytest.raises(ValueError):
-        df_left.join(df_right, right_on="a")
-    with pytest.raises(ValueError):
-        df_left.join(df_right, left_on="a")
-
     df_a = pl.DataFrame({"a": [1, 2, 1, 1], "b": ["a", "b", "c", "c"]})
     df_b = pl.DataFrame(
         {"foo": [1, 1, 1], "bar": ["a", "c", "c"], "ham": ["let", "var", "const"]}
@@ -373,10 +413,33 @@ def test_join() -> None:
 
     cols = ["a", "b", "bar", "ham"]
     assert lazy_join.shape == eager_join.shape
-    assert lazy_join.sort(by=cols).frame_equal(eager_join.sort(by=cols))
+    pl.testing.assert_frame_equal(lazy_join.sort(by=cols), eager_join.sort(by=cols))
 
 
-def test_joins_dispatch() -> None:
+@pytest.mark.parametrize("kwargs", [{}, {"right_on": "a"}, {"left_on": "a"}])
+def test_join_missing_keys_raises(kwargs: dict[str, Any]) -> None:
+    df_left = pl.DataFrame({"a": ["a", "b", "a", "z"], "b": [1, 2, 3, 4]})
+    df_right = pl.DataFrame({"a": ["b", "c", "b", "a"], "k": [0, 3, 9, 6]})
+
+    # we need to pass in a column to join on, either by supplying `on`, or both
+    # `left_on` and `right_on`
+    with pytest.raises(ValueError):
+        df_left.join(df_right, **kwargs)
+
+
+@pytest.mark.parametrize("how", ["left", "inner", "outer"])
+@pytest.mark.parametrize(
+    "on",
+    [
+        ["a", "b", "date", "datetime"],
+        ["date", "datetime"],
+        ["date", "datetime", "a"],
+        ["date", "a"],
+        ["a", "datetime"],
+        ["date"],
+    ],
+)
+def test_joins_dispatch(how: JoinStrategy, on: list[str]) -> None:
     # this just flexes the dispatch a bit
 
     # don't change the data of this dataframe, this triggered:
@@ -392,32 +455,29 @@ def test_joins_dispatch() -> None:
         [pl.col("date").str.strptime(pl.Date), pl.col("datetime").cast(pl.Datetime)]
     )
 
-    join_strategies: list[JoinStrategy] = ["left", "inner", "outer"]
-    for how in join_strategies:
-        dfa.join(dfa, on=["a", "b", "date", "datetime"], how=how)
-        dfa.join(dfa, on=["date", "datetime"], how=how)
-        dfa.join(dfa, on=["date", "datetime", "a"], how=how)
-        dfa.join(dfa, on=["date", "a"], how=how)
-        dfa.join(dfa, on=["a", "datetime"], how=how)
-        dfa.join(dfa, on=["date"], how=how)
+    dfa.join(dfa, on=on, how=how)
 
 
 def test_join_on_cast() -> None:
     df_a = (
         pl.DataFrame({"a": [-5, -2, 3, 3, 9, 10]})
         .with_row_count()
-        .with_column(pl.col("a").cast(pl.Int32))
+        .with_columns([pl.col("a").cast(pl.Int32)])
     )
 
     df_b = pl.DataFrame({"a": [-2, -3, 3, 10]})
 
-    assert df_a.join(df_b, on=pl.col("a").cast(pl.Int64)).to_dict(False) == {
-        "row_nr": [1, 2, 3, 5],
-        "a": [-2, 3, 3, 10],
-    }
-    assert df_a.lazy().join(
-        df_b.lazy(), on=pl.col("a").cast(pl.Int64)
-    ).collect().to_dict(False) == {"row_nr": [1, 2, 3, 5], "a": [-2, 3, 3, 10]}
+    assert_frame_dict(
+        df_a.join(df_b, on=pl.col("a").cast(pl.Int64)),
+        {
+            "row_nr": [1, 2, 3, 5],
+            "a": [-2, 3, 3, 10],
+        },
+    )
+    assert_frame_dict(
+        df_a.lazy().join(df_b.lazy(), on=pl.col("a").cast(pl.Int64)).collect(),
+        {"row_nr": [1, 2, 3, 5], "a": [-2, 3, 3, 10]},
+    )
 
 
 def test_asof_join_projection_resolution_4606() -> None:
@@ -450,49 +510,62 @@ def test_join_chunks_alignment_4720() -> None:
             "index3": pl.arange(100, 102, eager=True),
         }
     )
-    assert (
+    assert_frame_dict(
         df1.join(df2, how="cross").join(
             df3,
             on=["index1", "index2", "index3"],
             how="left",
-        )
-    ).to_dict(False) == {
-        "index1": [0, 0, 1, 1],
-        "index2": [10, 10, 11, 11],
-        "index3": [100, 101, 100, 101],
-    }
+        ),
+        {
+            "index1": [0, 0, 1, 1],
+            "index2": [10, 10, 11, 11],
+            "index3": [100, 101, 100, 101],
+        },
+    )
 
-    assert (
+    assert_frame_dict(
         df1.join(df2, how="cross").join(
             df3,
             on=["index3", "index1", "index2"],
             how="left",
-        )
-    ).to_dict(False) == {
-        "index1": [0, 0, 1, 1],
-        "index2": [10, 10, 11, 11],
-        "index3": [100, 101, 100, 101],
-    }
+        ),
+        {
+            "index1": [0, 0, 1, 1],
+            "index2": [10, 10, 11, 11],
+            "index3": [100, 101, 100, 101],
+        },
+    )
 
 
-def test_sorted_flag_after_joins() -> None:
+@pytest.fixture(scope="session")
+def random_int_frames() -> RandomIntFrames:
+    # random (unsorted) join inputs keyed by their (left, right) height
     np.random.seed(1)
-    dfa = pl.DataFrame(
-        {
-            "a": np.random.randint(0, 13, 20),
-            "b": np.random.randint(0, 13, 20),
-        }
-    ).sort("a")
 
-    dfb = pl.DataFrame(
-        {
-            "a": np.random.randint(0, 13, 10),
-            "b": np.random.randint(0, 13, 10),
-        }
-    )
+    def random_frame(n: int, high: int, random_b: bool) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "a": np.random.randint(0, high, n),
+                "b": np.random.randint(0, high, n) if random_b else np.arange(0, n),
+            }
+        )
 
+    frames: RandomIntFrames = {}
+    for (n_a, n_b), high, random_b in [
+        ((20, 10), 13, True),
+        ((200, 40), 100, False),
+        ((100, 100), 40, False),
+    ]:
+        dfa = random_frame(n_a, high, random_b)
+        dfb = random_frame(n_b, high, random_b)
+        frames[(n_a, n_b)] = (dfa, dfb, pl.from_pandas(dfa), pl.from_pandas(dfb))
+    return frames
+
+
+def test_sorted_flag_after_joins(random_int_frames: RandomIntFrames) -> None:
+    _, dfbpd, dfa, dfb = random_int_frames[(20, 10)]
+    dfa = dfa.sort("a")
     dfapd = dfa.to_pandas()
-    dfbpd = dfb.to_pandas()
 
     def test_with_pd(
         dfa: pd.DataFrame, dfb: pd.DataFrame, on: str, how: str, joined: pl.DataFrame
@@ -537,43 +610,28 @@ def test_sorted_flag_after_joins() -> None:
 
 
 @typing.no_type_check
-def test_jit_sort_joins() -> None:
-    n = 200
-    dfa = pd.DataFrame(
-        {
-            "a": np.random.randint(0, 100, n),
-            "b": np.arange(0, n),
-        }
-    )
+def test_jit_sort_joins(random_int_frames: RandomIntFrames) -> None:
+    dfa, dfb, dfa_pl_unsorted, dfb_pl = random_int_frames[(200, 40)]
+    dfa_pl = dfa_pl_unsorted.sort("a")
 
-    n = 40
-    dfb = pd.DataFrame(
-        {
-            "a": np.random.randint(0, 100, n),
-            "b": np.arange(0, n),
-        }
-    )
-    dfa_pl = pl.from_pandas(dfa).sort("a")
-    dfb_pl = pl.from_pandas(dfb)
+    # sanity check the join itself against pandas once
+    pd_result = dfa.merge(dfb, on="a", how="left")
+    pd_result.columns = ["a", "b", "b_right"]
+    a = pl.from_pandas(pd_result).with_columns([pl.all().cast(int)]).sort(["a", "b"])
+    pl_result = dfa_pl.join(dfb_pl, on="a", how="left").sort(["a", "b"])
+    pl.testing.assert_frame_equal(a, pl_result)
 
     for how in ["left", "inner"]:
-        pd_result = dfa.merge(dfb, on="a", how=how)
-        pd_result.columns = ["a", "b", "b_right"]
-
         # left key sorted right is not
         pl_result = dfa_pl.join(dfb_pl, on="a", how=how).sort(["a", "b"])
-
-        a = pl.from_pandas(pd_result).with_column(pl.all().cast(int)).sort(["a", "b"])
-        assert a.frame_equal(pl_result, null_equal=True)
+        expected = dfa_pl_unsorted.join(dfb_pl, on="a", how=how).sort(["a", "b"])
+        pl.testing.assert_frame_equal(pl_result, expected)
         assert pl_result["a"].flags["SORTED_ASC"]
 
-        # left key sorted right is not
-        pd_result = dfb.merge(dfa, on="a", how=how)
-        pd_result.columns = ["a", "b", "b_right"]
+        # right key sorted left is not
         pl_result = dfb_pl.join(dfa_pl, on="a", how=how).sort(["a", "b"])
-
-        a = pl.from_pandas(pd_result).with_column(pl.all().cast(int)).sort(["a", "b"])
-        assert a.frame_equal(pl_result, null_equal=True)
+        expected = dfb_pl.join(dfa_pl_unsorted, on="a", how=how).sort(["a", "b"])
+        pl.testing.assert_frame_equal(pl_result, expected)
         assert pl_result["a"].flags["SORTED_ASC"]
 
 
@@ -617,7 +675,7 @@ def test_asof_join_schema_5684() -> None:
     projected_result = q.select(pl.all()).collect()
     result = q.collect()
 
-    assert projected_result.frame_equal(result)
+    pl.testing.assert_frame_equal(projected_result, result)
     assert (
         q.schema
         == projected_result.schema
@@ -626,51 +684,26 @@ def test_asof_join_schema_5684() -> None:
 
 
 @typing.no_type_check
-def test_streaming_joins() -> None:
-    n = 100
-    dfa = pd.DataFrame(
-        {
-            "a": np.random.randint(0, 40, n),
-            "b": np.arange(0, n),
-        }
-    )
-
-    n = 100
-    dfb = pd.DataFrame(
-        {
-            "a": np.random.randint(0, 40, n),
-            "b": np.arange(0, n),
-        }
+def test_streaming_joins(random_int_frames: RandomIntFrames) -> None:
+    dfa, dfb, dfa_pl, dfb_pl = random_int_frames[(100, 100)]
+    dfa_pl = dfa_pl.sort("a")
+
+    # sanity check the join itself against pandas once
+    pd_result = dfa.merge(dfb, on="a", how="inner")
+    pd_result.columns = ["a", "b", "b_right"]
+    pl_result = (
+        dfa_pl.lazy()
+        .join(dfb_pl.lazy(), on="a", how="inner")
+        .sort(["a", "b"])
+        .collect(streaming=True)
     )
-    dfa_pl = pl.from_pandas(dfa).sort("a")
-    dfb_pl = pl.from_pandas(dfb)
+    a = pl.from_pandas(pd_result).with_columns([pl.all().cast(int)]).sort(["a", "b"])
+    pl.testing.assert_frame_equal(a, pl_result, check_dtype=False)
 
     for how in ["inner", "left"]:
-        pd_result = dfa.merge(dfb, on="a", how=how)
-        pd_result.columns = ["a", "b", "b_right"]
-
-        pl_result = (
-            dfa_pl.lazy()
-            .join(dfb_pl.lazy(), on="a", how=how)
-            .sort(["a", "b"])
-            .collect(streaming=True)
-        )
-
-        a = pl.from_pandas(pd_result).with_column(pl.all().cast(int)).sort(["a", "b"])
-        pl.testing.assert_frame_equal(a, pl_result, check_dtype=False)
-
-        pd_result = dfa.merge(dfb, on=["a", "b"], how=how)
-
-        pl_result = (
-            dfa_pl.lazy()
-            .join(dfb_pl.lazy(), on=["a", "b"], how=how)
-            .sort(["a", "b"])
-            .collect(streaming=True)
-        )
-
-        # we cast to integer because pandas joins creates floats
-        a = pl.from_pandas(pd_result).with_column(pl.all().cast(int)).sort(["a", "b"])
-        pl.testing.assert_frame_equal(a, pl_result, check_dtype=False)
+        for on in ["a", ["a", "b"]]:
+            q = dfa_pl.lazy().join(dfb_pl.lazy(), on=on, how=how).sort(["a", "b"])
+            pl.testing.assert_frame_equal(q.collect(streaming=True), q.collect())
 
 
 def test_join_asof_projection() -> None:
@@ -690,22 +723,32 @@ def test_join_asof_projection() -> None:
         }
     )
 
-    assert (
+    assert_frame_dict(
         (
-            df1.lazy().join_asof(df2.lazy(), left_on="df1_date", right_on="df2_date")
-        ).select([pl.col("df2_date"), "df1_date"])
-    ).collect().to_dict(False) == {
-        "df2_date": [None, 20221012, 20221012, 20221012, 20221015],
-        "df1_date": [20221011, 20221012, 20221013, 20221014, 20221016],
-    }
-    assert (
-        df1.lazy().join_asof(
-            df2.lazy(), by="key", left_on="df1_date", right_on="df2_date"
+            (
+                df1.lazy().join_asof(
+                    df2.lazy(), left_on="df1_date", right_on="df2_date"
+                )
+            ).select([pl.col("df2_date"), "df1_date"])
+        ).collect(),
+        {
+            "df2_date": [None, 20221012, 20221012, 20221012, 20221015],
+            "df1_date": [20221011, 20221012, 20221013, 20221014, 20221016],
+        },
+    )
+    assert_frame_dict(
+        (
+            df1.lazy().join_asof(
+                df2.lazy(), by="key", left_on="df1_date", right_on="df2_date"
+            )
         )
-    ).select(["df2_date", "df1_date"]).collect().to_dict(False) == {
-        "df2_date": [None, None, None, 20221012, 20221015],
-        "df1_date": [20221011, 20221012, 20221013, 20221014, 20221016],
-    }
+        .select(["df2_date", "df1_date"])
+        .collect(),
+        {
+            "df2_date": [None, None, None, 20221012, 20221015],
+            "df1_date": [20221011, 20221012, 20221013, 20221014, 20221016],
+        },
+    )
 
 
 def test_asof_join_by_logical_types() -> None:
@@ -715,21 +758,24 @@ def test_asof_join_by_logical_types() -> None:
         .head(9)
     )
     x = pl.DataFrame({"a": dates, "b": map(float, range(9)), "c": ["1", "2", "3"] * 3})
-    assert x.join_asof(x, on="b", by=["c", "a"]).to_dict(False) == {
-        "a": [
-            datetime(2022, 1, 1, 0, 0),
-            datetime(2022, 1, 1, 2, 0),
-            datetime(2022, 1, 1, 4, 0),
-            datetime(2022, 1, 1, 6, 0),
-            datetime(2022, 1, 1, 8, 0),
-            datetime(2022, 1, 1, 10, 0),
-            datetime(2022, 1, 1, 12, 0),
-            datetime(2022, 1, 1, 14, 0),
-            datetime(2022, 1, 1, 16, 0),
-        ],
-        "b": [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0],
-        "c": ["1", "2", "3", "1", "2", "3", "1", "2", "3"],
-    }
+    assert_frame_dict(
+        x.join_asof(x, on="b", by=["c", "a"]),
+        {
+            "a": [
+                datetime(2022, 1, 1, 0, 0),
+                datetime(2022, 1, 1, 2, 0),
+                datetime(2022, 1, 1, 4, 0),
+                datetime(2022, 1, 1, 6, 0),
+                datetime(2022, 1, 1, 8, 0),
+                datetime(2022, 1, 1, 10, 0),
+                datetime(2022, 1, 1, 12, 0),
+                datetime(2022, 1, 1, 14, 0),
+                datetime(2022, 1, 1, 16, 0),
+            ],
+            "b": [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0],
+            "c": ["1", "2", "3", "1", "2", "3", "1", "2", "3"],
+        },
+    )
 
 
 def test_join_panic_on_binary_expr_5915() -> None:
@@ -737,4 +783,4 @@ def test_join_panic_on_binary_expr_5915() -> None:
     df_b = pl.DataFrame({"b": [1, 4, 9, 9, 0]}).lazy()
 
     z = df_a.join(df_b, left_on=[(pl.col("a") + 1).cast(int)], right_on=[pl.col("b")])
-    assert z.collect().to_dict(False) == {"a": [4]}
+    assert_frame_dict(z.collect(), {"a": [4]})